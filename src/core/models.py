@@ -1 +0,0 @@
-# Database models will be defined here.
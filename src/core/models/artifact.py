@@ -1,7 +1,7 @@
 import uuid
 from sqlalchemy import Column, String, BigInteger, Boolean, DateTime, UUID, Text, ForeignKey, DECIMAL
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -10,7 +10,7 @@ class Artifact(Base):
     __tablename__ = "artifacts"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("scraping_jobs.id"), nullable=False)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("scraping_jobs.id"), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     artifact_type = Column(String(50), nullable=False)
     source_url = Column(Text, index=True)
@@ -32,9 +32,10 @@ class ContentExtraction(Base):
     __tablename__ = "content_extractions"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    artifact_id = Column(UUID(as_uuid=True), ForeignKey("artifacts.id"), nullable=False)
+    artifact_id = Column(UUID(as_uuid=True), ForeignKey("artifacts.id"), nullable=False, index=True)
     extraction_type = Column(String(50), nullable=False)
-    extracted_data = Column(JSONB)
+    # Potentially large; loaded only when accessed
+    extracted_data = deferred(Column(JSONB))
     confidence_score = Column(DECIMAL(3, 2))
     created_at = Column(DateTime, server_default=func.now())
 
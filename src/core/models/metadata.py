@@ -9,7 +9,7 @@ class MetadataTag(Base):
     __tablename__ = "metadata_tags"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    artifact_id = Column(UUID(as_uuid=True), ForeignKey("artifacts.id"), nullable=False)
+    artifact_id = Column(UUID(as_uuid=True), ForeignKey("artifacts.id"), nullable=False, index=True)
     tag_type = Column(String(50), nullable=False)
     tag_key = Column(String(100), nullable=False, index=True)
     tag_value = Column(Text)